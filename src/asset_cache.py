@@ -0,0 +1,172 @@
+"""
+靜態資源快取模組
+攔截 Notion 的 JS / CSS 等不會變動的靜態資源，存在本機磁碟，
+所有 page 與每次執行共用，減少重複下載
+"""
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import List, Optional
+
+
+# 會被快取的資源類型
+STATIC_RESOURCE_TYPES = {'script', 'stylesheet', 'font', 'image'}
+
+# 命中時回傳的標頭（含 CORS，跨來源的字型與 crossorigin script 才不會被擋）
+CACHED_HEADERS = (
+    'content-type',
+    'cache-control',
+    'access-control-allow-origin',
+    'access-control-allow-credentials',
+    'access-control-expose-headers',
+    'cross-origin-resource-policy',
+    'timing-allow-origin',
+    'vary',
+)
+
+
+class AssetCache:
+    """靜態資源磁碟快取（依網址查詢，相同內容的檔案以雜湊去重只存一份，依大小淘汰最久未用的資源）"""
+    
+    def __init__(self, folder, max_bytes: int, url_patterns: List[str]):
+        self.folder = Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.url_patterns = url_patterns
+        # 交給 context.route 的 matcher 必須是字串或正規表示式，才會在瀏覽器端比對；
+        # 傳入函式會讓 Playwright 攔截所有請求再逐一回到 Python 判斷
+        self.route_pattern = re.compile('|'.join(map(re.escape, url_patterns)))
+        
+        self.conn = sqlite3.connect(str(self.folder / 'index.db'))
+        with self.conn:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS assets (
+                    url TEXT PRIMARY KEY,
+                    hash TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            ''')
+        
+        self.reset_stats()
+    
+    def reset_stats(self):
+        """重設本次執行的統計"""
+        self.hits = 0
+        self.misses = 0
+        self.bytes_served = 0
+        self.bytes_fetched = 0
+    
+    def close(self):
+        """關閉索引資料庫"""
+        self.conn.close()
+    
+    def _blob_path(self, content_hash: str) -> Path:
+        return self.folder / content_hash[:2] / content_hash
+    
+    def _get(self, url: str) -> Optional[tuple]:
+        """讀取快取，回傳 (body, headers)，沒有時回傳 None"""
+        row = self.conn.execute(
+            'SELECT hash, headers FROM assets WHERE url = ?', (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        
+        content_hash, headers = row
+        try:
+            body = self._blob_path(content_hash).read_bytes()
+        except FileNotFoundError:
+            with self.conn:
+                self.conn.execute('DELETE FROM assets WHERE url = ?', (url,))
+            return None
+        
+        with self.conn:
+            self.conn.execute('UPDATE assets SET last_used = ? WHERE url = ?', (time.time(), url))
+        
+        return body, json.loads(headers)
+    
+    def _put(self, url: str, body: bytes, headers: dict):
+        """寫入快取（相同內容只存一份）"""
+        content_hash = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(content_hash)
+        
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = blob_path.with_name(blob_path.name + '.tmp')
+            tmp_path.write_bytes(body)
+            tmp_path.replace(blob_path)
+        
+        kept_headers = {k: headers[k] for k in CACHED_HEADERS if k in headers}
+        
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO assets (url, hash, size, headers, last_used) VALUES (?, ?, ?, ?, ?)',
+                (url, content_hash, len(body), json.dumps(kept_headers), time.time())
+            )
+        
+        self._evict()
+    
+    def _evict(self):
+        """總大小超過上限時，淘汰最久未使用的資源"""
+        total = self.conn.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM (SELECT hash, MAX(size) AS size FROM assets GROUP BY hash)'
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        rows = self.conn.execute(
+            'SELECT hash, MAX(last_used) AS used, MAX(size) FROM assets GROUP BY hash ORDER BY used'
+        ).fetchall()
+        
+        with self.conn:
+            for content_hash, _, size in rows:
+                if total <= self.max_bytes:
+                    break
+                self.conn.execute('DELETE FROM assets WHERE hash = ?', (content_hash,))
+                self._blob_path(content_hash).unlink(missing_ok=True)
+                total -= size
+    
+    def handle(self, route):
+        """Playwright route handler"""
+        request = route.request
+        if request.method != 'GET' or request.resource_type not in STATIC_RESOURCE_TYPES:
+            route.continue_()
+            return
+        
+        url = request.url
+        cached = self._get(url)
+        if cached is not None:
+            body, headers = cached
+            self.hits += 1
+            self.bytes_served += len(body)
+            route.fulfill(status=200, headers=headers, body=body)
+            return
+        
+        self.misses += 1
+        try:
+            response = route.fetch()
+        except Exception:
+            route.continue_()
+            return
+        
+        body = response.body()
+        self.bytes_fetched += len(body)
+        
+        if response.status == 200:
+            self._put(url, body, response.headers)
+        
+        route.fulfill(response=response, body=body)
+    
+    def report(self) -> str:
+        """本次執行的快取統計"""
+        total = self.hits + self.misses
+        ratio = self.hits / total * 100 if total else 0
+        return (
+            f"靜態資源快取命中 {self.hits}/{total} ({ratio:.0f}%)，"
+            f"本機提供 {self.bytes_served / 1024 / 1024:.1f} MB，"
+            f"下載 {self.bytes_fetched / 1024 / 1024:.1f} MB"
+        )
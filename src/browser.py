@@ -0,0 +1,249 @@
+"""
+瀏覽器生命週期管理模組
+長時間爬取時定期回收 page / context、監控 Chromium 記憶體，並在瀏覽器崩潰時自動重啟
+"""
+import os
+import sys
+from pathlib import Path
+from typing import Callable, Optional
+
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, Error as PlaywrightError
+
+from .asset_cache import AssetCache
+
+
+def _read_proc_tree() -> dict:
+    """
+    讀取 /proc，回傳 {pid: (ppid, rss_bytes, cmdline)}
+    非 Linux 平台回傳空 dict
+    """
+    proc = Path('/proc')
+    if not proc.exists():
+        return {}
+    
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    processes = {}
+    
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / 'stat').read_text()
+            # comm 可能含空白，從最後一個 ')' 之後開始切
+            fields = stat[stat.rindex(')') + 2:].split()
+            ppid = int(fields[1])
+            rss = int(fields[21]) * page_size
+            cmdline = (entry / 'cmdline').read_bytes().replace(b'\0', b' ').decode('utf-8', 'replace')
+            processes[int(entry.name)] = (ppid, rss, cmdline)
+        except (OSError, ValueError, IndexError):
+            continue
+    
+    return processes
+
+
+def chromium_rss() -> tuple:
+    """
+    計算本行程底下所有 Chromium 行程的 RSS
+    回傳 (renderer RSS, 全部 RSS)，單位 bytes
+    """
+    processes = _read_proc_tree()
+    if not processes:
+        return 0, 0
+    
+    children = {}
+    for pid, (ppid, _, _) in processes.items():
+        children.setdefault(ppid, []).append(pid)
+    
+    renderer = 0
+    total = 0
+    stack = list(children.get(os.getpid(), []))
+    
+    while stack:
+        pid = stack.pop()
+        _, rss, cmdline = processes[pid]
+        stack.extend(children.get(pid, []))
+        
+        # 只計算瀏覽器行程（排除 Playwright driver 本身）
+        if 'chrom' not in cmdline.lower():
+            continue
+        total += rss
+        if '--type=renderer' in cmdline:
+            renderer += rss
+    
+    return renderer, total
+
+
+def python_peak_rss() -> int:
+    """Python 行程本身的峰值 RSS（bytes），無法取得時回傳 0"""
+    try:
+        import resource
+    except ImportError:
+        return 0
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS 單位為 bytes，Linux 為 KB
+    if sys.platform == 'darwin':
+        return peak
+    return peak * 1024
+
+
+class BrowserManager:
+    """瀏覽器生命週期管理"""
+    
+    def __init__(self, config, log: Callable[[str], None] = print):
+        self.config = config
+        self.log = log
+        
+        self._playwright = None
+        self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+        self.page_crashed = False
+        
+        self.navigations = 0
+        self.recycles = 0
+        self.restarts = 0
+        self.peak_rss = 0
+        
+        # 所有 context 共用同一個靜態資源快取（start 時開啟，stop 時關閉）
+        self.asset_cache: Optional[AssetCache] = None
+    
+    def start(self):
+        """啟動瀏覽器（同時重設本次執行的統計）"""
+        self.recycles = 0
+        self.restarts = 0
+        self.peak_rss = 0
+        
+        if self.config.cache_enabled:
+            self.asset_cache = AssetCache(
+                self.config.cache_path,
+                max_bytes=self.config.cache_max_mb * 1024 * 1024,
+                url_patterns=self.config.cache_url_patterns
+            )
+        
+        self._playwright = sync_playwright().start()
+        self._launch()
+    
+    def stop(self):
+        """關閉瀏覽器"""
+        self._close_browser()
+        if self._playwright:
+            self._playwright.stop()
+            self._playwright = None
+        if self.asset_cache:
+            self.asset_cache.close()
+            self.asset_cache = None
+    
+    def _launch(self):
+        """啟動 Chromium 並開新的 context / page"""
+        self.browser = self._playwright.chromium.launch(headless=True)
+        self._new_context()
+    
+    def _new_context(self):
+        """開新的 context / page"""
+        self.context = self.browser.new_context()
+        if self.asset_cache:
+            # 只攔截靜態資源，其他請求不經過 Python
+            self.context.route(self.asset_cache.route_pattern, self.asset_cache.handle)
+        self.page = self.context.new_page()
+        self.page_crashed = False
+        self.page.on('crash', self._on_page_crash)
+        self.navigations = 0
+    
+    def _on_page_crash(self, page: Page):
+        """Renderer 崩潰（例如 OOM）時瀏覽器仍連線，需另外標記"""
+        if page is self.page:
+            self.page_crashed = True
+    
+    def _close_browser(self):
+        """關閉瀏覽器（忽略已崩潰的瀏覽器產生的錯誤）"""
+        if self.browser:
+            try:
+                self.browser.close()
+            except PlaywrightError:
+                pass
+        self.browser = None
+        self.context = None
+        self.page = None
+    
+    def recycle(self):
+        """回收目前的 context / page，釋放 renderer 記憶體"""
+        try:
+            self.context.close()
+        except PlaywrightError:
+            pass
+        self._new_context()
+        self.recycles += 1
+    
+    def restart(self):
+        """重新啟動瀏覽器"""
+        self._close_browser()
+        self._launch()
+        self.restarts += 1
+    
+    def _check_memory(self) -> int:
+        """取樣記憶體並更新峰值，回傳 renderer RSS"""
+        renderer, total = chromium_rss()
+        self.peak_rss = max(self.peak_rss, total)
+        return renderer
+    
+    def _recover(self):
+        """
+        從崩潰中恢復
+        只有 renderer 崩潰時回收 context / page 即可，瀏覽器斷線才整個重啟
+        """
+        if self.browser is not None and self.browser.is_connected():
+            self.recycle()
+        else:
+            self.restart()
+    
+    def _before_navigation(self):
+        """導覽前檢查是否需要重啟或回收"""
+        if self._is_crashed():
+            self.log("    ⚠️ 瀏覽器或 page 已崩潰，恢復中")
+            self._recover()
+            return
+        
+        renderer_rss = self._check_memory()
+        limit = self.config.crawl_max_renderer_rss_mb * 1024 * 1024
+        
+        if limit and renderer_rss > limit:
+            self.log(f"    ♻️ Renderer 記憶體 {renderer_rss / 1024 / 1024:.0f} MB 超過上限，回收 page")
+            self.recycle()
+        elif self.config.crawl_recycle_after and self.navigations >= self.config.crawl_recycle_after:
+            self.recycle()
+    
+    def _is_crashed(self) -> bool:
+        """判斷瀏覽器或 page 是否已崩潰（含 renderer 崩潰）"""
+        if self.browser is None or not self.browser.is_connected():
+            return True
+        return self.page is None or self.page_crashed or self.page.is_closed()
+    
+    def goto(self, url: str, **kwargs):
+        """
+        導覽到指定網址
+        瀏覽器或 renderer 崩潰時自動恢復並重試，直到超過 max_browser_restarts
+        """
+        self._before_navigation()
+        
+        attempts = 0
+        while True:
+            try:
+                response = self.page.goto(url, **kwargs)
+                self.navigations += 1
+                return response
+            except PlaywrightError:
+                if not self._is_crashed() or attempts >= self.config.crawl_max_browser_restarts:
+                    raise
+                attempts += 1
+                self.log(f"    ⚠️ 瀏覽器或 page 崩潰，恢復後重試（第 {attempts} 次）")
+                self._recover()
+    
+    def memory_report(self) -> str:
+        """本次執行的記憶體峰值摘要"""
+        self._check_memory()
+        return (
+            f"Chromium 峰值 {self.peak_rss / 1024 / 1024:.0f} MB，"
+            f"Python 峰值 {python_peak_rss() / 1024 / 1024:.0f} MB，"
+            f"回收 {self.recycles} 次，重啟 {self.restarts} 次"
+        )
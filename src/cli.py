@@ -1,6 +1,15 @@
 #!/usr/bin/env python3
 """
 命令列介面
+
+子命令：
+    crawl     執行爬蟲（預設）
+    rerender  從儲存的會議紀錄重新產生 Markdown
+    status    顯示回溯進度
+    stats     統計輸出資料夾
+
+Playwright、YAML 等較重的模組只在需要的子命令內才載入，
+讓 --help 與不需瀏覽器的子命令能快速啟動。
 """
 import sys
 import click
@@ -8,8 +17,19 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List
 
-from .config import Config
-from .scraper import MeetingScraper
+
+class DefaultCommandGroup(click.Group):
+    """
+    未指定子命令時預設執行 crawl
+    相容舊用法：python -m src.cli --date 2026-02-12
+    """
+    
+    default_command = 'crawl'
+    
+    def parse_args(self, ctx, args):
+        if not args or (args[0] not in self.commands and args[0] != '--help'):
+            args = [self.default_command] + list(args)
+        return super().parse_args(ctx, args)
 
 
 def get_date_range(from_date: str, to_date: str) -> List[str]:
@@ -28,7 +48,42 @@ def get_date_range(from_date: str, to_date: str) -> List[str]:
     return dates
 
 
-@click.command()
+def load_config(config: str = None, output: str = None):
+    """
+    載入設定檔並套用命令列覆寫
+    """
+    from .config import Config
+    
+    if config:
+        cfg = Config(config)
+    else:
+        cfg = Config()
+    
+    if output:
+        cfg._config.setdefault('output', {})['folder'] = output
+    
+    return cfg
+
+
+@click.group(cls=DefaultCommandGroup)
+def main():
+    """
+    Notion 會議爬蟲
+    
+    \b
+    範例：
+        python -m src.cli                                    # 執行爬蟲（今天）
+        python -m src.cli crawl --date 2026-02-12            # 指定日期
+        python -m src.cli crawl --from 2026-02-02 --to 2026-02-13  # 回溯日期範圍
+        python -m src.cli crawl --from 2026-02-02 --to 2026-02-13 --resume  # 從中斷處繼續
+        python -m src.cli crawl --category 數據週會議          # 只爬特定分類
+        python -m src.cli rerender                           # 重新產生 Markdown
+        python -m src.cli status                             # 顯示回溯進度
+        python -m src.cli stats                              # 統計輸出資料夾
+    """
+
+
+@main.command()
 @click.option('--config', '-c', default=None, help='設定檔路徑')
 @click.option('--date', '-d', default=None, help='參照日期 (YYYY-MM-DD)')
 @click.option('--from', 'from_date', default=None, help='回溯起始日期 (YYYY-MM-DD)')
@@ -37,30 +92,27 @@ def get_date_range(from_date: str, to_date: str) -> List[str]:
 @click.option('--output', '-o', default=None, help='輸出資料夾')
 @click.option('--verbose', '-v', is_flag=True, default=True, help='顯示詳細日誌')
 @click.option('--quiet', '-q', is_flag=True, default=False, help='安靜模式')
-def main(config, date, from_date, to_date, category, output, verbose, quiet):
+@click.option('--resume', is_flag=True, default=False, help='從上次中斷的地方繼續')
+def crawl(config, date, from_date, to_date, category, output, verbose, quiet, resume):
     """
-    Notion 會議爬蟲
-    
-    範例：
-        python -m notion_scraper                      # 執行爬蟲（今天）
-        python -m notion_scraper --date 2026-02-12   # 指定日期
-        python -m notion_scraper --from 2026-02-02 --to 2026-02-13  # 回溯日期範圍
-        python -m notion_scraper --category 數據週會議  # 只爬特定分類
+    執行爬蟲
     """
     try:
         # 載入設定
-        if config:
-            cfg = Config(config)
-        else:
-            cfg = Config()
-        
-        # 覆寫設定
-        if output:
-            cfg._config['output']['folder'] = output
+        cfg = load_config(config, output)
         
         if quiet:
             verbose = False
         
+        # 只爬特定分類
+        if category:
+            categories = cfg._config.get('notion', {}).get('categories', [])
+            matched = [c for c in categories if c.get('name') == category]
+            if not matched:
+                print(f"錯誤: 找不到分類 {category}")
+                sys.exit(1)
+            cfg._config['notion']['categories'] = matched
+        
         # 決定執行日期
         execute_dates = []
         
@@ -76,6 +128,26 @@ def main(config, date, from_date, to_date, category, output, verbose, quiet):
             today = datetime.now().strftime('%Y-%m-%d')
             execute_dates = [today]
         
+        # 執行日誌：只有回溯或續跑才使用，單日執行不會覆蓋進行中的回溯日誌
+        journal = None
+        
+        if (from_date and to_date) or resume:
+            from .journal import RunJournal
+            
+            journal = RunJournal(cfg.journal_path)
+            category_names = [c['name'] for c in cfg.enabled_categories]
+            
+            if resume and journal.matches(execute_dates, category_names):
+                progress = journal.progress()
+                print(f"⏯️ 續跑：已完成 {progress['done']}/{progress['total']} 個單位")
+            else:
+                if resume:
+                    print("⚠️ 找不到相同範圍的執行日誌，從頭開始")
+                journal.begin(execute_dates, category_names)
+        
+        # 延遲載入：只有真的要爬時才載入 Playwright
+        from .scraper import MeetingScraper
+        
         # 建立爬蟲
         scraper = MeetingScraper(cfg, verbose=verbose)
         
@@ -83,6 +155,10 @@ def main(config, date, from_date, to_date, category, output, verbose, quiet):
         total_saved = 0
         
         for exec_date in execute_dates:
+            if journal and journal.is_date_done(exec_date):
+                print(f"⏭️ {exec_date} 已完成，略過")
+                continue
+            
             print(f"\n{'='*50}")
             print(f"📅 執行日期: {exec_date}")
             print(f"{'='*50}")
@@ -90,13 +166,13 @@ def main(config, date, from_date, to_date, category, output, verbose, quiet):
             scraper.output_folder = Path(cfg.output_folder) / exec_date
             scraper.output_folder.mkdir(parents=True, exist_ok=True)
             
-            saved = scraper.run(reference_date=exec_date)
+            saved = scraper.run(reference_date=exec_date, journal=journal)
             total_saved += saved
             
             print(f"✅ {exec_date} 完成：儲存 {saved} 筆")
         
         print(f"\n🎉 全部完成！總共儲存 {total_saved} 筆")
-        
+    
     except FileNotFoundError as e:
         print(f"錯誤: {e}")
         sys.exit(1)
@@ -108,5 +184,103 @@ def main(config, date, from_date, to_date, category, output, verbose, quiet):
         sys.exit(1)
 
 
+@main.command()
+@click.option('--config', '-c', default=None, help='設定檔路徑')
+@click.option('--output', '-o', default=None, help='輸出資料夾')
+@click.option('--workers', '-j', type=int, default=None, help='平行行程數（預設為 CPU 數）')
+def rerender(config, output, workers):
+    """
+    從儲存的會議紀錄重新產生 Markdown（不需啟動瀏覽器）
+    """
+    try:
+        cfg = load_config(config, output)
+    except FileNotFoundError as e:
+        print(f"錯誤: {e}")
+        sys.exit(1)
+    
+    if not Path(cfg.store_path).exists():
+        print(f"找不到會議紀錄: {cfg.store_path}")
+        return
+    
+    from .rerender import rerender_all
+    
+    counts = rerender_all(cfg, workers=workers)
+    print(
+        f"🔄 重新產生完成：更新 {counts['written']} 筆，未變更 {counts['unchanged']} 筆，"
+        f"移除舊檔 {counts['removed']} 筆"
+    )
+    if counts['untracked']:
+        print(f"⚠️ 有 {counts['untracked']} 個 meetings-*.md 不在會議紀錄中，未自動刪除")
+
+
+@main.command()
+@click.option('--config', '-c', default=None, help='設定檔路徑')
+@click.option('--output', '-o', default=None, help='輸出資料夾')
+def status(config, output):
+    """
+    顯示最近一次爬取的進度（不需啟動瀏覽器）
+    """
+    try:
+        cfg = load_config(config, output)
+    except FileNotFoundError as e:
+        print(f"錯誤: {e}")
+        sys.exit(1)
+    
+    from .journal import RunJournal
+    
+    journal = RunJournal(cfg.journal_path)
+    if journal.data is None:
+        print("尚無執行日誌")
+        return
+    
+    dates = journal.data['dates']
+    progress = journal.progress()
+    
+    print(f"📅 範圍: {dates[0]} ~ {dates[-1]}（{len(dates)} 天 × {len(journal.data['categories'])} 個分類）")
+    print(f"🕒 開始: {progress['started_at']}，最後更新: {progress['updated_at']}")
+    print(f"✅ 已完成 {progress['done']}/{progress['total']}，剩餘 {progress['remaining']} 個單位")
+    
+    if progress['next_unit']:
+        next_date, next_category = progress['next_unit']
+        print(f"⏯️ 剩餘 {len(progress['remaining_dates'])} 天，下一個: {next_date}【{next_category}】")
+        print("   使用 crawl --resume 搭配相同的日期與分類繼續")
+    else:
+        print("🎉 全部完成")
+
+
+@main.command()
+@click.option('--config', '-c', default=None, help='設定檔路徑')
+@click.option('--output', '-o', default=None, help='輸出資料夾')
+def stats(config, output):
+    """
+    統計輸出資料夾（不需啟動瀏覽器）
+    """
+    try:
+        cfg = load_config(config, output)
+    except FileNotFoundError as e:
+        print(f"錯誤: {e}")
+        sys.exit(1)
+    
+    root = Path(cfg.output_folder)
+    if not root.exists():
+        print(f"輸出資料夾不存在: {root}")
+        return
+    
+    total_files = 0
+    total_bytes = 0
+    
+    for date_dir in sorted(p for p in root.iterdir() if p.is_dir()):
+        files = list(date_dir.glob('meetings-*.md'))
+        if not files:
+            continue
+        
+        size = sum(f.stat().st_size for f in files)
+        total_files += len(files)
+        total_bytes += size
+        print(f"📅 {date_dir.name}: {len(files)} 筆 ({size / 1024:.1f} KB)")
+    
+    print(f"\n總共 {total_files} 筆 ({total_bytes / 1024:.1f} KB)")
+
+
 if __name__ == "__main__":
     main()
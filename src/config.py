@@ -2,7 +2,7 @@
 設定檔讀取模組
 """
 import os
-import yaml
+import json
 from pathlib import Path
 from typing import Optional
 
@@ -18,13 +18,47 @@ class Config:
         self.config_path = Path(config_path)
         self._config = self._load()
     
+    @property
+    def _parsed_cache_path(self) -> Path:
+        """解析後設定的快取檔（JSON，與設定檔放在同一個資料夾）"""
+        return self.config_path.with_name(f".{self.config_path.name}.cache.json")
+    
     def _load(self) -> dict:
-        """載入 YAML 設定檔"""
+        """
+        載入 YAML 設定檔
+        設定檔沒變動時直接讀取 JSON 快取，省下載入與解析 yaml 的時間
+        """
         if not self.config_path.exists():
             raise FileNotFoundError(f"找不到設定檔: {self.config_path}")
         
+        stat = self.config_path.stat()
+        source = [stat.st_mtime_ns, stat.st_size]
+        
+        try:
+            with open(self._parsed_cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('source') == source:
+                return cached['config']
+        except (OSError, ValueError):
+            pass
+        
+        # 延遲載入 yaml，避免拖慢 CLI 啟動；有 libyaml 時使用 C 版解析器
+        import yaml
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        
         with open(self.config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            config = yaml.load(f, Loader=loader)
+        
+        # 快取寫入失敗（例如唯讀目錄）不影響執行
+        try:
+            tmp_path = self._parsed_cache_path.with_name(self._parsed_cache_path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'source': source, 'config': config}, f, ensure_ascii=False)
+            os.replace(tmp_path, self._parsed_cache_path)
+        except (OSError, TypeError, ValueError):
+            pass
+        
+        return config
     
     @property
     def output_folder(self) -> str:
@@ -34,6 +68,16 @@ class Config:
     def output_date_format(self) -> str:
         return self._config.get('output', {}).get('date_format', '%Y%m%d')
     
+    @property
+    def store_path(self) -> str:
+        store_file = self._config.get('output', {}).get('store_file', '.meetings.db')
+        return str(Path(self.output_folder) / store_file)
+    
+    @property
+    def journal_path(self) -> str:
+        journal_file = self._config.get('output', {}).get('journal_file', '.journal.json')
+        return str(Path(self.output_folder) / journal_file)
+    
     @property
     def sanitize_config(self) -> dict:
         return self._config.get('output', {}).get('sanitize', {})
@@ -58,6 +102,39 @@ class Config:
     def crawl_max_pages(self) -> int:
         return self._config.get('crawl', {}).get('max_pages_per_category', 10)
     
+    @property
+    def crawl_probe_listing(self) -> bool:
+        return self._config.get('crawl', {}).get('probe_listing', True)
+    
+    @property
+    def crawl_recycle_after(self) -> int:
+        return self._config.get('crawl', {}).get('recycle_after', 50)
+    
+    @property
+    def crawl_max_renderer_rss_mb(self) -> int:
+        return self._config.get('crawl', {}).get('max_renderer_rss_mb', 1024)
+    
+    @property
+    def crawl_max_browser_restarts(self) -> int:
+        return self._config.get('crawl', {}).get('max_browser_restarts', 3)
+    
+    @property
+    def cache_enabled(self) -> bool:
+        return self._config.get('cache', {}).get('enabled', True)
+    
+    @property
+    def cache_path(self) -> str:
+        cache_folder = self._config.get('cache', {}).get('folder', '.asset-cache')
+        return str(Path(self.output_folder) / cache_folder)
+    
+    @property
+    def cache_max_mb(self) -> int:
+        return self._config.get('cache', {}).get('max_mb', 512)
+    
+    @property
+    def cache_url_patterns(self) -> list:
+        return self._config.get('cache', {}).get('url_patterns', ['/_assets/'])
+    
     @property
     def date_reference(self) -> str:
         return self._config.get('options', {}).get('date_reference', '2026-02-12')
@@ -73,6 +150,14 @@ class Config:
     @property
     def extract_notes(self) -> bool:
         return self._config.get('options', {}).get('extract_notes', True)
+    
+    @property
+    def extract_transcript(self) -> bool:
+        return self._config.get('options', {}).get('extract_transcript', False)
+    
+    @property
+    def transcript_max_bytes(self) -> int:
+        return self._config.get('options', {}).get('transcript_max_bytes', 2 * 1024 * 1024)
 
 
 def sanitize_filename(name: str, config: dict = None) -> str:
@@ -2,7 +2,8 @@
 Markdown 格式化模組
 """
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Tuple
 
 
 class MarkdownFormatter:
@@ -97,6 +98,46 @@ class MarkdownFormatter:
         
         return yaml_text + content_text
     
+    def format_digest(self, date: str, meetings: list) -> str:
+        """
+        格式化當日跨分類摘要
+        meetings 需已依分類排序
+        """
+        lines = [
+            "---",
+            f"date: {date}",
+            f"meetings: {len(meetings)}",
+            "---",
+            "",
+            f"# 📅 {date} 會議摘要",
+            "",
+        ]
+        
+        current_category = None
+        for meeting in meetings:
+            # 分類標題
+            if meeting['category'] != current_category:
+                current_category = meeting['category']
+                lines.append(f"## {current_category}")
+                lines.append("")
+            
+            heading = meeting.get('title') or meeting.get('subcategory') or meeting['file']
+            lines.append(f"### 📋 {heading}")
+            lines.append("")
+            
+            if meeting.get('subcategory'):
+                lines.append(f"- 子分類：{meeting['subcategory']}")
+            lines.append(f"- 檔案：[{meeting['file']}]({meeting['file']})")
+            lines.append("")
+            
+            if meeting.get('summary'):
+                lines.append(meeting['summary'])
+                lines.append("")
+        
+        lines.append("---")
+        
+        return '\n'.join(lines)
+    
     def generate_filename(
         self,
         category: str,
@@ -119,6 +160,41 @@ class MarkdownFormatter:
             filename = f"meetings-{clean_category}-{date_str}.md"
         
         return filename
+    
+    def render_record(self, record: dict) -> Tuple[str, str]:
+        """
+        由會議紀錄產生 (檔名, Markdown 內容)
+        爬蟲儲存與 rerender 共用，確保兩者輸出完全一致
+        """
+        category = record.get('category', '')
+        subcategory = record.get('subcategory', '')
+        reference_date = record['reference_date']
+        
+        filename = self.generate_filename(
+            category=category,
+            subcategory=subcategory,
+            date_str=reference_date.replace('-', ''),
+            sanitize_func=sanitize_filename
+        )
+        
+        content = self.format_meeting(
+            category=category,
+            subcategory=subcategory,
+            date=record.get('parsed_date', record.get('date', '未知')),
+            title=record.get('title', ''),
+            summary=record.get('summary', ''),
+            notes=record.get('notes', ''),
+            notion_url=record.get('url', ''),
+            crawled_at=datetime.fromisoformat(record['crawled_at']),
+            reference_date=reference_date
+        )
+        
+        return filename, content
+
+
+def transcript_filename(filename: str) -> str:
+    """會議 Markdown 對應的逐字稿檔名"""
+    return Path(filename).with_suffix('.transcript.txt.gz').name
 
 
 def sanitize_filename(name: str) -> str:
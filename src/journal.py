@@ -0,0 +1,112 @@
+"""
+執行日誌模組
+記錄回溯爬取已完成的 (日期, 分類, 頁面)，中斷後可從上次停下的地方繼續
+"""
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Set
+
+
+class RunJournal:
+    """回溯爬取的執行日誌（JSON，每完成一個單位就寫回）"""
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.data = self._load()
+    
+    def _load(self) -> Optional[dict]:
+        """載入日誌，不存在時回傳 None"""
+        if not self.path.exists():
+            return None
+        
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _save(self):
+        """寫回日誌（先寫暫存檔再取代，避免中斷時留下半個檔案）"""
+        self.data['updated_at'] = datetime.now().isoformat()
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+    
+    @staticmethod
+    def _unit_key(reference_date: str, category: str) -> str:
+        return f"{reference_date}|{category}"
+    
+    def matches(self, dates: List[str], categories: List[str]) -> bool:
+        """目前的日誌是否屬於同一個回溯範圍與分類"""
+        return (
+            self.data is not None
+            and self.data.get('dates') == dates
+            and self.data.get('categories') == categories
+        )
+    
+    def begin(self, dates: List[str], categories: List[str]):
+        """開始新的回溯（覆蓋舊日誌）"""
+        self.data = {
+            'dates': dates,
+            'categories': categories,
+            'started_at': datetime.now().isoformat(),
+            'completed': [],
+            'pages': {},
+        }
+        self._save()
+    
+    def is_done(self, reference_date: str, category: str) -> bool:
+        """該日期的該分類是否已完成"""
+        return self._unit_key(reference_date, category) in self.data['completed']
+    
+    def is_date_done(self, reference_date: str) -> bool:
+        """該日期的所有分類是否都已完成"""
+        return all(self.is_done(reference_date, c) for c in self.data['categories'])
+    
+    def done_pages(self, reference_date: str, category: str) -> Set[str]:
+        """該日期的該分類中已處理的頁面"""
+        return set(self.data['pages'].get(self._unit_key(reference_date, category), []))
+    
+    def mark_page(self, reference_date: str, category: str, page_id: str):
+        """記錄已處理的頁面（不論日期是否符合）"""
+        pages = self.data['pages'].setdefault(self._unit_key(reference_date, category), [])
+        if page_id not in pages:
+            pages.append(page_id)
+            self._save()
+    
+    def mark_category(self, reference_date: str, category: str):
+        """記錄已完成的分類"""
+        key = self._unit_key(reference_date, category)
+        if key not in self.data['completed']:
+            self.data['completed'].append(key)
+        self.data['pages'].pop(key, None)
+        self._save()
+    
+    def progress(self) -> dict:
+        """回溯進度摘要"""
+        dates = self.data['dates']
+        categories = self.data['categories']
+        total = len(dates) * len(categories)
+        done = len(self.data['completed'])
+        
+        remaining_dates = [d for d in dates if not self.is_date_done(d)]
+        next_unit = None
+        for d in remaining_dates:
+            for c in categories:
+                if not self.is_done(d, c):
+                    next_unit = (d, c)
+                    break
+            if next_unit:
+                break
+        
+        return {
+            'total': total,
+            'done': done,
+            'remaining': total - done,
+            'remaining_dates': remaining_dates,
+            'next_unit': next_unit,
+            'started_at': self.data.get('started_at'),
+            'updated_at': self.data.get('updated_at'),
+        }
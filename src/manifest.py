@@ -0,0 +1,115 @@
+"""
+每日清單模組
+在每個日期資料夾維護 manifest.json，並由清單重建當日的跨分類摘要，不需重新掃描會議檔案
+"""
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+
+MANIFEST_FILENAME = 'manifest.json'
+
+
+def content_hash(content: str) -> str:
+    """Markdown 內容的 SHA-256"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def manifest_entry(record: dict, filename: str, content: str) -> dict:
+    """由會議紀錄與輸出內容組成清單項目"""
+    return {
+        'category': record.get('category', ''),
+        'subcategory': record.get('subcategory', ''),
+        'title': record.get('title', ''),
+        'summary': record.get('summary', ''),
+        'file': filename,
+        'content_hash': content_hash(content),
+        'reference_date': record['reference_date'],
+    }
+
+
+def _atomic_write(path: Path, text: str):
+    """先寫暫存檔再取代，讀取端不會看到寫到一半的檔案"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class DailyManifest:
+    """單一日期資料夾的會議清單"""
+    
+    def __init__(self, folder, formatter):
+        self.folder = Path(folder)
+        self.formatter = formatter
+        self.path = self.folder / MANIFEST_FILENAME
+        self.data = self._load()
+    
+    def _load(self) -> dict:
+        """載入清單，不存在時回傳空清單"""
+        if not self.path.exists():
+            return {'date': '', 'meetings': {}}
+        
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def update(self, entries: List[dict]):
+        """
+        新增或更新會議項目，寫回清單並重建摘要
+        entry 欄位：category, subcategory, title, summary, file, content_hash, reference_date
+        """
+        meetings = dict(self.data['meetings'])
+        for entry in entries:
+            meetings[entry['file']] = entry
+        
+        self._commit(meetings)
+    
+    def replace(self, entries: List[dict]):
+        """
+        以完整的會議項目取代整份清單（rerender 使用，移除已不存在的檔案）
+        清單未變動時仍重建摘要，摘要格式變更或摘要被刪除後也會重新產生
+        """
+        self._commit({entry['file']: entry for entry in entries}, rebuild_digest=True)
+    
+    def _commit(self, meetings: dict, rebuild_digest: bool = False):
+        """清單有變動時寫回並重建摘要"""
+        if meetings != self.data['meetings']:
+            self.data['meetings'] = meetings
+            if meetings:
+                self.data['date'] = next(iter(meetings.values()))['reference_date']
+            self.data['updated_at'] = datetime.now().isoformat()
+            
+            self.folder.mkdir(parents=True, exist_ok=True)
+            _atomic_write(
+                self.path,
+                json.dumps(self.data, ensure_ascii=False, indent=2, sort_keys=True)
+            )
+        elif not rebuild_digest:
+            return
+        
+        self._write_digest()
+    
+    def _write_digest(self):
+        """由清單重建當日摘要（內容相同時不寫入）"""
+        date = self.data['date']
+        if not date:
+            return
+        
+        meetings = sorted(
+            self.data['meetings'].values(),
+            key=lambda m: (m['category'], m.get('subcategory', ''), m['file'])
+        )
+        
+        path = self.folder / f"digest-{date.replace('-', '')}.md"
+        content = self.formatter.format_digest(date, meetings)
+        
+        try:
+            if path.read_text(encoding='utf-8') == content:
+                return
+        except FileNotFoundError:
+            pass
+        
+        _atomic_write(path, content)
@@ -0,0 +1,110 @@
+"""
+重新產生 Markdown 模組
+從儲存的會議紀錄重新產生整個輸出資料夾，不需啟動瀏覽器
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .formatter import MarkdownFormatter, transcript_filename
+from .manifest import DailyManifest, manifest_entry
+from .store import MeetingStore
+
+
+def _render_one(args: Tuple[str, str, dict]) -> Tuple[str, str, dict, Optional[dict], bool]:
+    """
+    重新產生單一會議檔案（在子行程中執行）
+    回傳 (狀態, 資料夾, 清單項目, 檔名有變時更新後的紀錄（否則 None）, 是否移除舊檔)，
+    狀態為 'written' 或 'unchanged'
+    """
+    root, date_format, record = args
+    
+    formatter = MarkdownFormatter(date_format)
+    filename, content = formatter.render_record(record)
+    
+    folder = Path(root) / record.get('folder', '')
+    filepath = folder / filename
+    data = content.encode('utf-8')
+    
+    # 檔名規則改變時移除舊檔，逐字稿跟著改名
+    removed = False
+    old_filename = record.get('file')
+    if old_filename and old_filename != filename:
+        old_path = folder / old_filename
+        if old_path.exists():
+            old_path.unlink()
+            removed = True
+        
+        if record.get('transcript_file'):
+            old_transcript = folder / record['transcript_file']
+            new_transcript = folder / transcript_filename(filename)
+            if old_transcript.exists():
+                old_transcript.replace(new_transcript)
+            record['transcript_file'] = new_transcript.name
+    
+    changed_record = None
+    if old_filename != filename:
+        record['file'] = filename
+        changed_record = record
+    
+    entry = manifest_entry(record, filename, content)
+    
+    # 內容相同就不重寫
+    try:
+        if filepath.read_bytes() == data:
+            return 'unchanged', str(folder), entry, changed_record, removed
+    except FileNotFoundError:
+        pass
+    
+    folder.mkdir(parents=True, exist_ok=True)
+    filepath.write_bytes(data)
+    return 'written', str(folder), entry, changed_record, removed
+
+
+def _untracked_files(folder: str, entries: List[dict]) -> List[Path]:
+    """資料夾中不是由會議紀錄產生的 meetings-*.md（例如建立紀錄前爬的舊檔）"""
+    produced = {entry['file'] for entry in entries}
+    return sorted(p for p in Path(folder).glob('meetings-*.md') if p.name not in produced)
+
+
+def rerender_all(config, workers: int = None) -> Dict[str, int]:
+    """
+    依儲存的會議紀錄重新產生所有 Markdown
+    回傳各狀態的筆數
+    """
+    store = MeetingStore(config.store_path)
+    root = config.output_folder
+    date_format = config.output_date_format
+    
+    tasks = [(root, date_format, record) for record in store.records()]
+    counts = {'written': 0, 'unchanged': 0, 'removed': 0, 'untracked': 0}
+    
+    if not tasks:
+        return counts
+    
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (workers * 4))
+    
+    entries: Dict[str, List[dict]] = {}
+    changed_records = []
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for status, folder, entry, record, removed in executor.map(_render_one, tasks, chunksize=chunksize):
+            counts[status] += 1
+            counts['removed'] += removed
+            entries.setdefault(folder, []).append(entry)
+            if record is not None:
+                changed_records.append(record)
+    
+    # 更新紀錄中的檔名（SQLite 只在主行程寫入）
+    for record in changed_records:
+        store.save(record)
+    
+    # 每個日期資料夾以這次產生的完整清單取代舊清單（內容沒變時不會重寫）
+    formatter = MarkdownFormatter(date_format)
+    for folder, folder_entries in entries.items():
+        DailyManifest(folder, formatter).replace(folder_entries)
+        counts['untracked'] += len(_untracked_files(folder, folder_entries))
+    
+    return counts
@@ -2,15 +2,23 @@
 """
 Notion 會議爬蟲核心模組
 """
+import os
 import re
+import gzip
+import hashlib
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright, Page, Browser
-
+from .browser import BrowserManager
 from .parser import DateParser
-from .formatter import MarkdownFormatter, sanitize_filename
+from .formatter import MarkdownFormatter, sanitize_filename, transcript_filename
+from .store import MeetingStore
+from .manifest import DailyManifest, manifest_entry
+
+
+# 每次從頁面讀出的逐字稿長度（字元）
+TRANSCRIPT_CHUNK_CHARS = 64 * 1024
 
 
 class MeetingScraper:
@@ -25,9 +33,9 @@ class MeetingScraper:
         self.verbose = verbose
         self.parser = DateParser(config.date_reference)
         self.formatter = MarkdownFormatter(config.output_date_format)
+        self.store = MeetingStore(config.store_path)
         
-        self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
+        self.browser_manager = BrowserManager(config, log=self.log)
         
         # 建立輸出資料夾
         self.output_folder = Path(config.output_folder)
@@ -38,96 +46,136 @@ class MeetingScraper:
         if self.verbose:
             print(message)
     
+    @property
+    def page(self):
+        """目前使用中的 page（可能因回收或重啟而更換）"""
+        return self.browser_manager.page
+    
     def start(self):
         """啟動瀏覽器"""
-        self.browser = sync_playwright().chromium.launch(headless=True)
-        self.page = self.browser.new_page()
+        self.browser_manager.start()
     
     def stop(self):
         """關閉瀏覽器"""
-        if self.browser:
-            self.browser.close()
+        self.log(f"  🧠 {self.browser_manager.memory_report()}")
+        if self.browser_manager.asset_cache:
+            self.log(f"  📦 {self.browser_manager.asset_cache.report()}")
+        self.browser_manager.stop()
     
-    def crawl_category(self, category: dict, reference_date: str) -> List[dict]:
+    def crawl_category(self, category: dict, reference_date: str, journal=None) -> Tuple[List[dict], bool]:
         """
-        爬取單一分類
+        爬取單一分類，符合參照日期的會議一找到就儲存
+        journal: RunJournal，每處理完一個子頁面就記錄，續跑時略過
+        分類頁載入失敗時拋出例外
+        回傳 (已儲存的會議, 是否每個子頁面都處理成功)
         """
         category_name = category['name']
         category_url = category['url']
         
         self.log(f"\n【{category_name}】")
         
-        # 取得所有會議頁面（含子分類）
-        all_meetings = self._get_all_meetings(category_url, category_name)
+        # 取得需要開啟的子頁面
+        skip_pages = journal.done_pages(reference_date, category_name) if journal else None
+        subpages = self._get_category_subpages(category_url, category_name, reference_date, skip_pages)
         
-        # 過濾只保留今天的會議
+        found = 0
+        failed = 0
         today_meetings = []
         
-        for meeting in all_meetings:
-            meeting_date = meeting.get('date', '')
+        # 爬取每個子頁面
+        for subpage in subpages:
+            try:
+                meeting = self._crawl_subpage(subpage, category_name, reference_date)
+            except Exception as e:
+                # 失敗的頁面不記錄，續跑或下次執行時重新開啟
+                self.log(f"    ✗ Error: {e}")
+                failed += 1
+                continue
             
-            # 解析日期
-            if meeting_date:
-                parsed_date = self.parser.parse(meeting_date)
-                meeting['parsed_date'] = parsed_date
-                
-                # 取得 YYYY-MM-DD 格式
-                date_only = self.parser.get_date_only(meeting_date)
-                meeting['date_only'] = date_only
+            if meeting is not None:
+                found += 1
                 
                 # 比對今天
-                if date_only == reference_date:
-                    today_meetings.append(meeting)
+                if meeting.get('date_only') == reference_date:
                     self.log(f"  ✓ 符合今天日期: {meeting.get('title', '無標題')[:30]}")
-            else:
-                # 沒有日期，嘗試從標題抓
-                title = meeting.get('title', '')
-                date_from_title = self._extract_date_from_title(title)
-                if date_from_title:
-                    meeting['parsed_date'] = date_from_title
-                    meeting['date_only'] = date_from_title
-                    
-                    if date_from_title == reference_date:
-                        today_meetings.append(meeting)
-                        self.log(f"  ✓ 從標題找到今天日期: {title[:30]}")
+                    try:
+                        self.save_meeting(meeting, category_name, reference_date)
+                    except Exception as e:
+                        # 儲存失敗（磁碟、資料庫、清單）同樣不記錄，續跑時重新開啟
+                        self.log(f"    ✗ Error saving: {e}")
+                        failed += 1
+                        continue
+                    today_meetings.append(meeting)
+            
+            if journal:
+                journal.mark_page(reference_date, category_name, subpage['page_id'])
         
-        self.log(f"  → 總共 {len(all_meetings)} 筆，符合今天 {len(today_meetings)} 筆")
+        self.log(f"  → 總共 {found} 筆，符合今天 {len(today_meetings)} 筆")
+        if failed:
+            self.log(f"  ⚠️ {failed} 個子頁面失敗，續跑時重試")
         
-        return today_meetings
+        return today_meetings, failed == 0
     
-    def _get_all_meetings(self, url: str, category_name: str) -> List[dict]:
-        """取得所有會議"""
-        meetings = []
+    def _get_category_subpages(
+        self,
+        url: str,
+        category_name: str,
+        reference_date: str,
+        skip_pages: Set[str] = None
+    ) -> List[dict]:
+        """載入分類頁，回傳需要開啟的子頁面"""
+        self.browser_manager.goto(url, wait_until="domcontentloaded", timeout=self.config.crawl_timeout)
+        self.page.wait_for_timeout(self.config.crawl_wait_time)
         
-        try:
-            self.page.goto(url, wait_until="domcontentloaded", timeout=self.config.crawl_timeout)
-            self.page.wait_for_timeout(self.config.crawl_wait_time)
-            
-            # 取得子頁面連結
-            subpages = self._get_subpages()
-            
-            # 爬取每個子頁面
-            for subpage in subpages[:self.config.crawl_max_pages]:
-                try:
-                    self.page.goto(subpage['url'], wait_until="domcontentloaded", timeout=self.config.crawl_timeout)
-                    self.page.wait_for_timeout(self.config.crawl_wait_time)
-                    
-                    # 取得會議資訊
-                    info = self._extract_meeting_info(subpage['url'])
-                    
-                    if info.get('title') or info.get('summary'):
-                        info['category'] = category_name
-                        info['subcategory'] = subpage.get('title', '')
-                        meetings.append(info)
-                        self.log(f"    ✓ {info.get('title', '無標題')[:30]}")
-                        
-                except Exception as e:
-                    self.log(f"    ✗ Error: {e}")
-                    
-        except Exception as e:
-            self.log(f"  ✗ Error loading category: {e}")
+        # 取得子頁面連結
+        subpages = self._get_subpages()[:self.config.crawl_max_pages]
+        
+        # 略過續跑前已處理的頁面
+        if skip_pages:
+            subpages = [p for p in subpages if p['page_id'] not in skip_pages]
         
-        return meetings
+        # 依列表資訊略過未變更的子頁面
+        return self._probe_subpages(subpages, category_name, reference_date)
+    
+    def _crawl_subpage(self, subpage: dict, category_name: str, reference_date: str) -> Optional[dict]:
+        """
+        開啟單一子頁面並提取會議資訊
+        沒有內容時回傳 None；頁面未渲染完成或提取失敗時拋出例外
+        """
+        self.browser_manager.goto(subpage['url'], wait_until="domcontentloaded", timeout=self.config.crawl_timeout)
+        self.page.wait_for_timeout(self.config.crawl_wait_time)
+        
+        # 取得會議資訊
+        info = self._extract_meeting_info(subpage['url'])
+        
+        if not info['rendered']:
+            raise RuntimeError(f"頁面未渲染完成: {subpage.get('title', '')[:30]}")
+        
+        if not (info.get('title') or info.get('summary')):
+            # 確實沒有內容的頁面也記錄下來，未變更時不再開啟
+            self.store.save_listing(category_name, subpage['page_id'], subpage['fingerprint'], None)
+            return None
+        
+        info['category'] = category_name
+        info['subcategory'] = subpage.get('title', '')
+        info['page_id'] = subpage['page_id']
+        info['fingerprint'] = subpage['fingerprint']
+        self.log(f"    ✓ {info.get('title', '無標題')[:30]}")
+        
+        date_only = self._resolve_date_only(info)
+        
+        # 只為符合參照日期的會議擷取逐字稿
+        if self.config.extract_transcript and date_only == reference_date:
+            self._save_transcript(info, category_name, reference_date)
+        
+        # 記錄列表指紋與實際日期，供下次執行略過未變更的子頁面；
+        # 有內容卻沒解析出日期（例如日期欄位尚未渲染）時不記錄，下次一定重新開啟
+        if date_only:
+            self.store.save_listing(category_name, subpage['page_id'], subpage['fingerprint'], date_only)
+        else:
+            self.store.delete_listing(category_name, subpage['page_id'])
+        
+        return info
     
     def _get_subpages(self) -> List[dict]:
         """取得頁面中所有子頁面連結"""
@@ -144,7 +192,10 @@ class MeetingScraper:
                     
                     if (text && text.length > 2 && text.length < 80 && href) {
                         if (!text.includes('Skip to') && !text.includes('Sign up')) {
-                            result.push({ title: text, url: href });
+                            // 列表上同一列的文字（顯示日期、最後編輯時間等）
+                            const row = anchor.closest('[role="row"], tr, .notion-collection-item, [data-block-id]');
+                            const rowText = row ? row.innerText.trim() : text;
+                            result.push({ title: text, url: href, row_text: rowText });
                         }
                     }
                 });
@@ -157,30 +208,81 @@ class MeetingScraper:
             for link in links:
                 if link['title'] not in seen:
                     seen.add(link['title'])
+                    link['page_id'] = self._page_id(link['url'])
+                    link['fingerprint'] = self._listing_fingerprint(link)
                     subpages.append(link)
                     
         except Exception as e:
             self.log(f"Error getting subpages: {e}")
+            raise
         
         return subpages
     
+    def _page_id(self, url: str) -> str:
+        """從網址取出 Notion 頁面 ID，取不到時使用網址本身"""
+        # 頁面 ID 為最後一段路徑末尾的 32 個十六進位字元（可能含 - 分隔）
+        last_segment = re.split(r'[?#]', url)[0].rstrip('/').rsplit('/', 1)[-1]
+        match = re.search(r'([0-9a-f]{32})$', last_segment.replace('-', ''))
+        return match.group(1) if match else url
+    
+    def _listing_fingerprint(self, link: dict) -> str:
+        """列表項目的指紋（標題、網址、同列文字）"""
+        text = '\n'.join([link.get('title', ''), link.get('url', ''), link.get('row_text', '')])
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+    
+    def _probe_subpages(self, subpages: List[dict], category_name: str, reference_date: str) -> List[dict]:
+        """
+        比對上次執行記錄的列表指紋，只保留需要開啟的子頁面：
+        - 新出現或列表資訊有變動
+        - 列表上的日期或上次記錄的日期符合參照日期
+        """
+        if not self.config.crawl_probe_listing:
+            return subpages
+        
+        previous = self.store.get_listings(category_name)
+        selected = []
+        
+        for subpage in subpages:
+            last = previous.get(subpage['page_id'])
+            if last is None or last['fingerprint'] != subpage['fingerprint']:
+                selected.append(subpage)
+                continue
+            
+            listing_date = (
+                self.parser.get_date_only(subpage.get('row_text', ''))
+                or self._extract_date_from_title(subpage.get('title', ''))
+            )
+            if reference_date in (listing_date, last['date_only']):
+                selected.append(subpage)
+        
+        skipped = len(subpages) - len(selected)
+        if skipped:
+            self.log(f"  ⏭️ 列表未變更，略過 {skipped} 個子頁面")
+        
+        return selected
+    
     def _extract_meeting_info(self, url: str) -> dict:
-        """從頁面提取會議資訊"""
+        """
+        從頁面提取會議資訊
+        rendered 表示頁面已渲染出標題；評估失敗時拋出例外，由呼叫端決定是否重試
+        """
         result = {
             'title': '',
             'date': '',
             'summary': '',
             'notes': '',
-            'url': url
+            'url': url,
+            'rendered': False
         }
         
         try:
             # 取得標題
             title = self.page.evaluate('''() => {
                 const heading = document.querySelector('h1');
-                return heading ? heading.innerText : '';
+                return heading ? heading.innerText : null;
             }''')
-            result['title'] = title.strip()
+            result['rendered'] = title is not None
+            result['title'] = (title or '').strip()
             
             # 取得日期
             date_text = self.page.evaluate('''() => {
@@ -223,9 +325,101 @@ class MeetingScraper:
                 
         except Exception as e:
             self.log(f"Error extracting info: {e}")
+            raise
         
         return result
     
+    def _resolve_date_only(self, meeting: dict) -> Optional[str]:
+        """
+        解析會議日期，寫入 parsed_date / date_only 並回傳 YYYY-MM-DD
+        優先使用頁面日期，沒有時從標題抓
+        """
+        meeting_date = meeting.get('date', '')
+        
+        if meeting_date:
+            meeting['parsed_date'] = self.parser.parse(meeting_date)
+            meeting['date_only'] = self.parser.get_date_only(meeting_date)
+        else:
+            date_from_title = self._extract_date_from_title(meeting.get('title', ''))
+            if date_from_title:
+                meeting['parsed_date'] = date_from_title
+                meeting['date_only'] = date_from_title
+        
+        return meeting.get('date_only')
+    
+    def _save_transcript(self, meeting: dict, category: str, reference_date: str):
+        """
+        將逐字稿分段讀出，以 gzip 寫到會議 Markdown 旁邊
+        超過 transcript_max_bytes 的部分會被截斷
+        """
+        filename = self.formatter.generate_filename(
+            category=category,
+            subcategory=meeting.get('subcategory', ''),
+            date_str=reference_date.replace('-', ''),
+            sanitize_func=sanitize_filename
+        )
+        filepath = self.output_folder / transcript_filename(filename)
+        tmp_path = filepath.with_name(filepath.name + '.tmp')
+        
+        try:
+            # 逐字稿留在頁面中，之後分段取回，避免一次傳整個字串
+            length = self.page.evaluate('''() => {
+                const allText = document.body.innerText;
+                const index = allText.search(/Transcript/);
+                window.__transcript = index >= 0 ? allText.slice(index + 'Transcript'.length).trim() : '';
+                return window.__transcript.length;
+            }''')
+            
+            if not length:
+                # 頁面已沒有逐字稿，移除上次留下的檔案
+                filepath.unlink(missing_ok=True)
+                return
+            
+            max_bytes = self.config.transcript_max_bytes
+            written = 0
+            start = 0
+            truncated = False
+            
+            with gzip.open(tmp_path, 'wb') as f:
+                while start < length:
+                    chunk, start = self.page.evaluate('''([start, size]) => {
+                        const text = window.__transcript;
+                        let end = Math.min(start + size, text.length);
+                        // 避免切斷 UTF-16 代理對
+                        const code = text.charCodeAt(end - 1);
+                        if (end < text.length && code >= 0xD800 && code <= 0xDBFF) {
+                            end -= 1;
+                        }
+                        return [text.slice(start, end), end];
+                    }''', [start, TRANSCRIPT_CHUNK_CHARS])
+                    
+                    data = chunk.encode('utf-8')
+                    if max_bytes and written + len(data) > max_bytes:
+                        data = data[:max_bytes - written].decode('utf-8', 'ignore').encode('utf-8')
+                        truncated = True
+                    
+                    f.write(data)
+                    written += len(data)
+                    
+                    if truncated:
+                        break
+            
+            os.replace(tmp_path, filepath)
+            
+            meeting['transcript_file'] = filepath.name
+            suffix = "（已截斷）" if truncated else ""
+            self.log(f"    📜 逐字稿 {written / 1024:.0f} KB{suffix}")
+            
+        except Exception as e:
+            self.log(f"    ✗ Error extracting transcript: {e}")
+            if tmp_path.exists():
+                tmp_path.unlink()
+        finally:
+            try:
+                self.page.evaluate('() => { delete window.__transcript; }')
+            except Exception:
+                pass
+    
     def _extract_date_from_title(self, title: str) -> Optional[str]:
         """從標題提取日期"""
         # 嘗試找日期格式
@@ -257,42 +451,52 @@ class MeetingScraper:
         """
         儲存單一會議到檔案
         """
-        subcategory = meeting.get('subcategory', '')
-        
-        # 產生檔名
-        filename = self.formatter.generate_filename(
-            category=category,
-            subcategory=subcategory,
-            date_str=reference_date.replace('-', ''),
-            sanitize_func=sanitize_filename
-        )
+        # 組成會議紀錄（保留原始欄位，供 rerender 使用）
+        record = {
+            key: meeting.get(key)
+            for key in ('title', 'date', 'parsed_date', 'date_only', 'summary', 'notes', 'url', 'transcript_file')
+            if key in meeting
+        }
+        record['category'] = category
+        record['subcategory'] = meeting.get('subcategory', '')
+        record['reference_date'] = reference_date
+        record['crawled_at'] = datetime.now().isoformat()
+        record['folder'] = self._relative_folder()
         
+        # 產生檔名與內容
+        filename, content = self.formatter.render_record(record)
         filepath = self.output_folder / filename
         
-        # 格式化內容
-        content = self.formatter.format_meeting(
-            category=category,
-            subcategory=subcategory,
-            date=meeting.get('parsed_date', meeting.get('date', '未知')),
-            title=meeting.get('title', ''),
-            summary=meeting.get('summary', ''),
-            notes=meeting.get('notes', ''),
-            notion_url=meeting.get('url', ''),
-            crawled_at=datetime.now(),
-            reference_date=reference_date
-        )
+        # 記下輸出檔名，rerender 改名時才能移除舊檔
+        record['file'] = filename
+        self.store.save(record)
         
         # 寫入檔案
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(content)
         
+        # 更新當日清單與摘要
+        DailyManifest(self.output_folder, self.formatter).update(
+            [manifest_entry(record, filename, content)]
+        )
+        
         self.log(f"  💾 已儲存: {filename}")
         
         return filepath
     
-    def run(self, reference_date: str = None):
+    def _relative_folder(self) -> str:
+        """目前輸出資料夾相對於根輸出資料夾的路徑"""
+        root = Path(self.config.output_folder).resolve()
+        folder = self.output_folder.resolve()
+        try:
+            return folder.relative_to(root).as_posix()
+        except ValueError:
+            return str(folder)
+    
+    def run(self, reference_date: str = None, journal=None):
         """
         執行爬蟲
+        journal: RunJournal，記錄已完成的分類與頁面，續跑時略過
         """
         if reference_date is None:
             reference_date = self.config.date_reference
@@ -309,12 +513,24 @@ class MeetingScraper:
         try:
             # 遍歷每個分類
             for category in self.config.enabled_categories:
-                today_meetings = self.crawl_category(category, reference_date)
+                category_name = category['name']
+                
+                if journal and journal.is_done(reference_date, category_name):
+                    self.log(f"\n【{category_name}】已完成，略過")
+                    continue
+                
+                try:
+                    today_meetings, complete = self.crawl_category(category, reference_date, journal)
+                except Exception as e:
+                    # 分類頁載入失敗：不記錄為完成，續跑時重試
+                    self.log(f"  ✗ Error loading category: {e}")
+                    continue
+                
+                saved_count += len(today_meetings)
                 
-                # 儲存今天的會議
-                for meeting in today_meetings:
-                    self.save_meeting(meeting, category['name'], reference_date)
-                    saved_count += 1
+                # 分類頁已載入且每個子頁面都處理成功，才記錄為完成
+                if journal and complete:
+                    journal.mark_category(reference_date, category_name)
                     
         finally:
             self.stop()
@@ -0,0 +1,108 @@
+"""
+會議資料儲存模組
+將爬取到的原始欄位存在輸出資料夾旁，之後不需重新爬取即可重新產生 Markdown
+"""
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+
+class MeetingStore:
+    """會議原始資料儲存（SQLite）"""
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+    
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.path))
+    
+    def _init_schema(self):
+        """建立資料表"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS meetings (
+                    folder TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    subcategory TEXT NOT NULL,
+                    reference_date TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (folder, category, subcategory, reference_date)
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS listings (
+                    category TEXT NOT NULL,
+                    page_id TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    date_only TEXT,
+                    PRIMARY KEY (category, page_id)
+                )
+            ''')
+    
+    def save(self, record: dict):
+        """
+        儲存單一會議紀錄
+        同一個資料夾、分類、子分類、日期只保留最新一筆（與輸出檔案一致）
+        """
+        data = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+        
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO meetings '
+                '(folder, category, subcategory, reference_date, data) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (
+                    record.get('folder', ''),
+                    record['category'],
+                    record.get('subcategory', ''),
+                    record['reference_date'],
+                    data,
+                )
+            )
+    
+    def records(self) -> Iterator[dict]:
+        """依日期順序取出所有會議紀錄"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                'SELECT data FROM meetings ORDER BY reference_date, folder, category, subcategory'
+            ).fetchall()
+        
+        for (data,) in rows:
+            yield json.loads(data)
+    
+    def get_listings(self, category: str) -> Dict[str, dict]:
+        """
+        取得上次執行記錄的列表資訊
+        回傳 {page_id: {'fingerprint': ..., 'date_only': ...}}
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                'SELECT page_id, fingerprint, date_only FROM listings WHERE category = ?',
+                (category,)
+            ).fetchall()
+        
+        return {
+            page_id: {'fingerprint': fingerprint, 'date_only': date_only}
+            for page_id, fingerprint, date_only in rows
+        }
+    
+    def save_listing(self, category: str, page_id: str, fingerprint: str, date_only: Optional[str]):
+        """記錄子頁面的列表指紋與實際會議日期"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO listings (category, page_id, fingerprint, date_only) '
+                'VALUES (?, ?, ?, ?)',
+                (category, page_id, fingerprint, date_only)
+            )
+    
+    def delete_listing(self, category: str, page_id: str):
+        """刪除子頁面的列表記錄，下次執行時一定會重新開啟"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                'DELETE FROM listings WHERE category = ? AND page_id = ?',
+                (category, page_id)
+            )
@@ -0,0 +1,83 @@
+"""
+靜態資源快取測試（以假的 route 物件模擬，不需瀏覽器）
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from src.asset_cache import AssetCache
+
+
+class FakeResponse:
+    def __init__(self, body, headers):
+        self.status = 200
+        self.headers = headers
+        self._body = body
+    
+    def body(self):
+        return self._body
+
+
+class FakeRoute:
+    def __init__(self, url, body=b'', headers=None, resource_type='script'):
+        self.request = SimpleNamespace(method='GET', url=url, resource_type=resource_type)
+        self.response = FakeResponse(body, headers or {})
+        self.fulfilled = None
+    
+    def fetch(self):
+        return self.response
+    
+    def continue_(self):
+        self.fulfilled = 'continue'
+    
+    def fulfill(self, **kwargs):
+        self.fulfilled = kwargs
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = AssetCache(tmp_path / 'cache', max_bytes=1000, url_patterns=['/_assets/'])
+    yield cache
+    cache.close()
+
+
+def test_route_pattern_matches_only_asset_urls(cache):
+    assert cache.route_pattern.search('https://www.notion.so/_assets/app-1234.js')
+    assert not cache.route_pattern.search('https://www.notion.so/api/v3/loadPageChunk')
+
+
+def test_route_pattern_escapes_configured_patterns(tmp_path):
+    cache = AssetCache(tmp_path / 'cache', max_bytes=1000, url_patterns=['/_assets/', '.woff2?v='])
+    try:
+        assert cache.route_pattern.search('https://example.com/font.woff2?v=3')
+        assert not cache.route_pattern.search('https://example.com/fontXwoff2?v=3')
+    finally:
+        cache.close()
+
+
+def test_hit_replays_body_and_cors_headers(cache):
+    url = 'https://www.notion.so/_assets/font.woff2'
+    headers = {
+        'content-type': 'font/woff2',
+        'access-control-allow-origin': '*',
+        'content-encoding': 'br',
+    }
+    cache.handle(FakeRoute(url, b'font', headers, resource_type='font'))
+    
+    route = FakeRoute(url, resource_type='font')
+    cache.handle(route)
+    
+    assert route.fulfilled['body'] == b'font'
+    assert route.fulfilled['headers'] == {
+        'content-type': 'font/woff2',
+        'access-control-allow-origin': '*',
+    }
+    assert (cache.hits, cache.misses, cache.bytes_served) == (1, 1, 4)
+
+
+def test_evicts_least_recently_used(cache):
+    for name in ('a', 'b', 'c'):
+        cache.handle(FakeRoute(f'https://www.notion.so/_assets/{name}.js', name.encode() * 400))
+    
+    urls = {row[0] for row in cache.conn.execute('SELECT url FROM assets')}
+    assert urls == {'https://www.notion.so/_assets/b.js', 'https://www.notion.so/_assets/c.js'}
@@ -0,0 +1,119 @@
+"""
+BrowserManager 崩潰恢復測試（以假的 browser / page 物件模擬，不啟動 Chromium）
+"""
+import re
+from types import SimpleNamespace
+
+import pytest
+
+playwright = pytest.importorskip('playwright.sync_api')
+
+from src.asset_cache import AssetCache
+from src.browser import BrowserManager, python_peak_rss
+
+
+class FakePage:
+    def __init__(self, browser):
+        self.browser = browser
+        self.handlers = {}
+        self.closed = False
+    
+    def on(self, event, handler):
+        self.handlers[event] = handler
+    
+    def crash(self):
+        self.handlers['crash'](self)
+    
+    def is_closed(self):
+        return self.closed
+    
+    def goto(self, url, **kwargs):
+        if self.browser.crash_next:
+            self.browser.crash_next = False
+            self.crash()
+        if self.browser.manager.page_crashed:
+            raise playwright.Error('Target crashed')
+        return url
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.routes = []
+    
+    def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+    
+    def new_page(self):
+        return FakePage(self.browser)
+    
+    def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.crash_next = False
+        self.manager = None
+    
+    def new_context(self):
+        return FakeContext(self)
+    
+    def is_connected(self):
+        return True
+    
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def manager():
+    config = SimpleNamespace(
+        cache_enabled=False,
+        crawl_recycle_after=0,
+        crawl_max_renderer_rss_mb=0,
+        crawl_max_browser_restarts=2,
+    )
+    manager = BrowserManager(config, log=lambda message: None)
+    manager.browser = FakeBrowser()
+    manager.browser.manager = manager
+    manager._new_context()
+    return manager
+
+
+def test_goto_recovers_from_renderer_crash(manager):
+    manager.browser.crash_next = True
+    
+    assert manager.goto('https://www.notion.so/a') == 'https://www.notion.so/a'
+    assert manager.recycles == 1
+    assert manager.restarts == 0
+
+
+def test_crashed_page_is_replaced_before_next_navigation(manager):
+    manager.page.crash()
+    
+    assert manager.goto('https://www.notion.so/b') == 'https://www.notion.so/b'
+    assert manager.recycles == 1
+
+
+def test_asset_route_is_matched_in_browser(manager, tmp_path):
+    manager.asset_cache = AssetCache(tmp_path / 'cache', max_bytes=1000, url_patterns=['/_assets/'])
+    try:
+        manager._new_context()
+        
+        [(pattern, handler)] = manager.context.routes
+        # 函式 matcher 會讓所有請求都回到 Python，必須是字串或正規表示式
+        assert isinstance(pattern, (str, re.Pattern))
+        assert pattern.search('https://www.notion.so/_assets/app.js')
+        assert handler == manager.asset_cache.handle
+    finally:
+        manager.asset_cache.close()
+
+
+@pytest.mark.parametrize('platform, expected', [('linux', 2048 * 1024), ('darwin', 2048)])
+def test_python_peak_rss_units(monkeypatch, platform, expected):
+    resource = pytest.importorskip('resource')
+    monkeypatch.setattr(resource, 'getrusage', lambda who: SimpleNamespace(ru_maxrss=2048))
+    monkeypatch.setattr('sys.platform', platform)
+    
+    assert python_peak_rss() == expected
@@ -0,0 +1,118 @@
+"""
+列表指紋比對測試（不啟動 Chromium）
+"""
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('playwright.sync_api')
+
+from src.config import Config
+from src.scraper import MeetingScraper
+
+
+DATE = '2026-02-12'
+PAGE_ID = '0123456789abcdef0123456789abcdef'
+
+
+@pytest.fixture
+def config(tmp_path):
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(
+        f"output:\n  folder: {tmp_path / 'output'}\n"
+        "cache:\n  enabled: false\n",
+        encoding='utf-8'
+    )
+    return Config(str(config_path))
+
+
+@pytest.fixture
+def scraper(config):
+    return MeetingScraper(config, verbose=False)
+
+
+def subpage(scraper, title='週會', row_text='週會 February 3, 2026'):
+    link = {'title': title, 'url': f'https://www.notion.so/so/Meeting-{PAGE_ID}', 'row_text': row_text}
+    link['page_id'] = scraper._page_id(link['url'])
+    link['fingerprint'] = scraper._listing_fingerprint(link)
+    return link
+
+
+@pytest.mark.parametrize('url', [
+    f'https://www.notion.so/so/Meeting-{PAGE_ID}',
+    f'https://www.notion.so/so/Meeting-{PAGE_ID}/',
+    f'https://www.notion.so/so/Meeting-{PAGE_ID}?pvs=4#heading',
+    'https://www.notion.so/so/Meeting-01234567-89ab-cdef-0123-456789abcdef',
+])
+def test_page_id_ignores_slug_and_query(scraper, url):
+    assert scraper._page_id(url) == PAGE_ID
+
+
+def test_page_id_falls_back_to_url(scraper):
+    assert scraper._page_id('https://www.notion.so/so/about') == 'https://www.notion.so/so/about'
+
+
+def test_fingerprint_changes_with_row_text(scraper):
+    link = subpage(scraper)
+    
+    assert scraper._listing_fingerprint(dict(link)) == link['fingerprint']
+    assert subpage(scraper, row_text='週會 February 4, 2026')['fingerprint'] != link['fingerprint']
+
+
+def test_new_page_is_selected(scraper):
+    link = subpage(scraper)
+    
+    assert scraper._probe_subpages([link], 'A', DATE) == [link]
+
+
+def test_unchanged_page_is_skipped(scraper):
+    link = subpage(scraper)
+    scraper.store.save_listing('A', link['page_id'], link['fingerprint'], '2026-02-03')
+    
+    assert scraper._probe_subpages([link], 'A', DATE) == []
+
+
+def test_changed_page_is_revisited(scraper):
+    link = subpage(scraper)
+    scraper.store.save_listing('A', link['page_id'], link['fingerprint'], '2026-02-03')
+    
+    changed = subpage(scraper, row_text='週會 February 3, 2026 Edited just now')
+    assert scraper._probe_subpages([changed], 'A', DATE) == [changed]
+
+
+def test_listing_date_match_is_revisited(scraper):
+    link = subpage(scraper, row_text='週會 February 12, 2026')
+    scraper.store.save_listing('A', link['page_id'], link['fingerprint'], '2026-02-03')
+    
+    assert scraper._probe_subpages([link], 'A', DATE) == [link]
+
+
+def test_stored_date_match_is_revisited(scraper):
+    link = subpage(scraper, row_text='週會')
+    scraper.store.save_listing('A', link['page_id'], link['fingerprint'], DATE)
+    
+    assert scraper._probe_subpages([link], 'A', DATE) == [link]
+
+
+def test_probe_listing_disabled_keeps_every_page(scraper):
+    link = subpage(scraper)
+    scraper.store.save_listing('A', link['page_id'], link['fingerprint'], '2026-02-03')
+    scraper.config._config['crawl'] = {'probe_listing': False}
+    
+    assert scraper._probe_subpages([link], 'A', DATE) == [link]
+
+
+def test_page_without_resolved_date_is_reprobed(scraper, monkeypatch):
+    link = subpage(scraper)
+    scraper.store.save_listing('A', link['page_id'], link['fingerprint'], '2026-02-03')
+    
+    # 標題已渲染但日期欄位沒有解析出來
+    monkeypatch.setattr(scraper.browser_manager, 'goto', lambda *args, **kwargs: None)
+    monkeypatch.setattr(scraper.browser_manager, 'page', SimpleNamespace(wait_for_timeout=lambda ms: None))
+    monkeypatch.setattr(scraper, '_extract_meeting_info', lambda url: {'rendered': True, 'title': '週會', 'date': ''})
+    
+    meeting = scraper._crawl_subpage(link, 'A', DATE)
+    
+    assert meeting.get('date_only') is None
+    assert scraper.store.get_listings('A') == {}
+    assert scraper._probe_subpages([link], 'A', DATE) == [link]
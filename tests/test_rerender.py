@@ -0,0 +1,102 @@
+"""
+rerender 測試（不需瀏覽器）
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from src.config import Config
+from src.formatter import MarkdownFormatter
+from src.manifest import DailyManifest, manifest_entry
+from src.rerender import rerender_all
+from src.store import MeetingStore
+
+
+@pytest.fixture
+def config(tmp_path):
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(f"output:\n  folder: {tmp_path / 'output'}\n", encoding='utf-8')
+    return Config(str(config_path))
+
+
+@pytest.fixture
+def store(config):
+    store = MeetingStore(config.store_path)
+    for subcategory in ('A', 'B'):
+        store.save({
+            'category': '數據週會議',
+            'subcategory': subcategory,
+            'reference_date': '2026-02-12',
+            'folder': '2026-02-12',
+            'title': f'會議 {subcategory}',
+            'summary': '摘要',
+            'notes': '',
+            'url': 'https://www.notion.so/x',
+            'crawled_at': '2026-02-12T08:00:00',
+        })
+    return store
+
+
+def test_rerender_only_rewrites_changed_files(config, store):
+    assert rerender_all(config, workers=1)['written'] == 2
+    
+    counts = rerender_all(config, workers=1)
+    assert counts['written'] == 0
+    assert counts['unchanged'] == 2
+
+
+def test_rerender_rebuilds_digest_when_manifest_is_unchanged(config, store, monkeypatch):
+    rerender_all(config, workers=1)
+    digest = Path(config.output_folder) / '2026-02-12' / 'digest-20260212.md'
+    
+    # 摘要被刪除
+    digest.unlink()
+    rerender_all(config, workers=1)
+    assert 'meetings: 2' in digest.read_text(encoding='utf-8')
+    
+    # 內容相同時不重寫
+    mtime = digest.stat().st_mtime_ns
+    rerender_all(config, workers=1)
+    assert digest.stat().st_mtime_ns == mtime
+    
+    # 摘要格式變更
+    monkeypatch.setattr(MarkdownFormatter, 'format_digest', lambda self, date, meetings: f'digest {len(meetings)}')
+    rerender_all(config, workers=1)
+    assert digest.read_text(encoding='utf-8') == 'digest 2'
+
+
+def test_rerender_removes_files_after_filename_change(config, store):
+    # 模擬舊的檔名規則產生的檔案
+    folder = Path(config.output_folder) / '2026-02-12'
+    folder.mkdir(parents=True)
+    for record in store.records():
+        old_name = f"old-{record['subcategory']}.md"
+        (folder / old_name).write_text('舊內容', encoding='utf-8')
+        record['file'] = old_name
+        store.save(record)
+        DailyManifest(folder, MarkdownFormatter()).update(
+            [manifest_entry(record, old_name, '舊內容')]
+        )
+    
+    counts = rerender_all(config, workers=1)
+    assert counts['removed'] == 2
+    
+    assert sorted(p.name for p in folder.glob('*.md') if not p.name.startswith('digest-')) == [
+        'meetings-數據週會議-A-20260212.md',
+        'meetings-數據週會議-B-20260212.md',
+    ]
+    assert {r['file'] for r in store.records()} == {
+        'meetings-數據週會議-A-20260212.md',
+        'meetings-數據週會議-B-20260212.md',
+    }
+    
+    # 清單與摘要只列出新檔名
+    manifest = json.loads((folder / 'manifest.json').read_text(encoding='utf-8'))
+    assert sorted(manifest['meetings']) == [
+        'meetings-數據週會議-A-20260212.md',
+        'meetings-數據週會議-B-20260212.md',
+    ]
+    digest = (folder / 'digest-20260212.md').read_text(encoding='utf-8')
+    assert 'old-' not in digest
+    assert 'meetings: 2' in digest
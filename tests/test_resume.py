@@ -0,0 +1,130 @@
+"""
+執行日誌續跑測試（以替換的 goto / 子頁面處理模擬，不啟動 Chromium）
+"""
+from types import SimpleNamespace
+
+import pytest
+from click.testing import CliRunner
+
+pytest.importorskip('playwright.sync_api')
+
+from src.cli import main
+from src.config import Config
+from src.journal import RunJournal
+from src.scraper import MeetingScraper
+
+
+DATE = '2026-02-12'
+
+
+@pytest.fixture
+def config(tmp_path):
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(
+        f"output:\n  folder: {tmp_path / 'output'}\n"
+        "cache:\n  enabled: false\n"
+        "notion:\n  categories:\n"
+        "    - name: A\n      url: https://www.notion.so/a\n"
+        "    - name: B\n      url: https://www.notion.so/b\n",
+        encoding='utf-8'
+    )
+    return Config(str(config_path))
+
+
+@pytest.fixture
+def scraper(config, monkeypatch):
+    scraper = MeetingScraper(config, verbose=False)
+    monkeypatch.setattr(scraper.browser_manager, 'start', lambda: None)
+    monkeypatch.setattr(scraper.browser_manager, 'stop', lambda: None)
+    monkeypatch.setattr(scraper.browser_manager, 'memory_report', lambda: '')
+    return scraper
+
+
+@pytest.fixture
+def journal(config):
+    journal = RunJournal(config.journal_path)
+    journal.begin([DATE], ['A', 'B'])
+    return journal
+
+
+def subpages(*page_ids):
+    return [{'title': p, 'url': f'https://www.notion.so/{p}', 'page_id': p, 'fingerprint': p} for p in page_ids]
+
+
+def test_category_load_failure_is_not_marked_done(scraper, journal, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError('Timeout')
+    
+    monkeypatch.setattr(scraper.browser_manager, 'goto', fail)
+    
+    assert scraper.run(DATE, journal=journal) == 0
+    assert journal.progress()['done'] == 0
+
+
+def test_pages_are_journaled_as_processed(scraper, journal, monkeypatch):
+    monkeypatch.setattr(scraper.browser_manager, 'goto', lambda *args, **kwargs: None)
+    monkeypatch.setattr(scraper.browser_manager, 'page', SimpleNamespace(wait_for_timeout=lambda ms: None))
+    monkeypatch.setattr(scraper, '_get_subpages', lambda: subpages('p1', 'p2', 'p3'))
+    
+    visited = []
+    
+    def crawl_subpage(subpage, category_name, reference_date):
+        visited.append(subpage['page_id'])
+        if subpage['page_id'] == 'p3':
+            raise RuntimeError('Target crashed')
+        # p1 符合日期，p2 不符合
+        date = DATE if subpage['page_id'] == 'p1' else '2026-01-01'
+        return {'title': subpage['title'], 'date_only': date, 'parsed_date': date, 'subcategory': ''}
+    
+    monkeypatch.setattr(scraper, '_crawl_subpage', crawl_subpage)
+    
+    assert scraper.run(DATE, journal=journal) == 2
+    
+    # 符合日期的會議一找到就儲存，不符合的頁面也記錄為已處理
+    assert journal.done_pages(DATE, 'A') == {'p1', 'p2'}
+    # 有子頁面失敗時分類不算完成
+    assert not journal.is_done(DATE, 'A')
+    
+    # 續跑只重新開啟失敗的頁面
+    visited.clear()
+    scraper.run(DATE, journal=journal)
+    assert visited == ['p3', 'p3']
+
+
+def test_single_date_run_keeps_backfill_journal(config, journal, monkeypatch):
+    journal.mark_category(DATE, 'A')
+    before = journal.path.read_text(encoding='utf-8')
+    
+    monkeypatch.setattr(MeetingScraper, 'run', lambda self, reference_date, journal=None: 0)
+    
+    result = CliRunner().invoke(main, ['crawl', '-c', str(config.config_path), '--date', '2026-02-13'])
+    
+    assert result.exit_code == 0, result.output
+    assert journal.path.read_text(encoding='utf-8') == before
+
+
+def test_save_failure_is_counted_per_page(scraper, journal, monkeypatch):
+    monkeypatch.setattr(scraper.browser_manager, 'goto', lambda *args, **kwargs: None)
+    monkeypatch.setattr(scraper.browser_manager, 'page', SimpleNamespace(wait_for_timeout=lambda ms: None))
+    monkeypatch.setattr(scraper, '_get_subpages', lambda: subpages('p1', 'p2'))
+    monkeypatch.setattr(
+        scraper, '_crawl_subpage',
+        lambda subpage, category_name, reference_date: {
+            'title': subpage['title'], 'date_only': DATE, 'parsed_date': DATE, 'subcategory': subpage['title'],
+        }
+    )
+    
+    def save_meeting(meeting, category, reference_date):
+        if meeting['title'] == 'p1':
+            raise OSError('No space left on device')
+    
+    monkeypatch.setattr(scraper, 'save_meeting', save_meeting)
+    
+    today_meetings, complete = scraper.crawl_category(
+        {'name': 'A', 'url': 'https://www.notion.so/a'}, DATE, journal
+    )
+    
+    # 儲存失敗的頁面不記錄，其餘頁面照常處理
+    assert [m['title'] for m in today_meetings] == ['p2']
+    assert not complete
+    assert journal.done_pages(DATE, 'A') == {'p2'}
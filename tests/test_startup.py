@@ -0,0 +1,102 @@
+"""
+CLI 啟動時間檢查
+不需瀏覽器的子命令不應載入 Playwright，模組載入與整體執行時間都需在預算內
+"""
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 最外層 import 累計載入時間上限（毫秒）
+IMPORT_BUDGET_MS = 80
+
+# 子命令從啟動到結束的實際耗時上限（毫秒，取多次執行的最小值以排除雜訊）
+WALL_CLOCK_BUDGET_MS = 100
+WALL_CLOCK_RUNS = 5
+
+
+@pytest.fixture
+def cli_args(tmp_path):
+    """
+    使用暫存資料夾中的設定檔副本，並先執行一次讓解析後的設定快取就緒
+    """
+    config_path = tmp_path / 'config.yaml'
+    shutil.copy(ROOT / 'config.yaml', config_path)
+    output = tmp_path / 'output'
+    
+    def build(args):
+        return [arg.format(config=config_path, output=output) for arg in args]
+    
+    run_cli(build(['status', '-c', '{config}', '-o', '{output}']))
+    assert (tmp_path / '.config.yaml.cache.json').exists()
+    return build
+
+
+def run_cli(args, *options):
+    result = subprocess.run(
+        [sys.executable, *options, '-m', 'src.cli'] + args,
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    return result
+
+
+def import_times(args):
+    """
+    以 python -X importtime 執行 CLI
+    回傳 (最外層 import 的累計載入時間 {模組: 微秒}, 所有載入的模組名稱)
+    """
+    result = run_cli(args, '-X', 'importtime')
+    
+    top_level = {}
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        modules.add(name.strip())
+        # 巢狀 import 的名稱前有縮排，最外層只有一個空白
+        if not name.startswith('  '):
+            top_level[name.strip()] = int(cumulative)
+    
+    return top_level, modules
+
+
+COMMANDS = [
+    ['--help'],
+    ['stats', '-c', '{config}', '-o', '{output}'],
+    ['status', '-c', '{config}', '-o', '{output}'],
+]
+
+
+@pytest.mark.parametrize('args', COMMANDS)
+def test_startup_without_browser(args, cli_args):
+    top_level, modules = import_times(cli_args(args))
+    
+    assert not any(name.split('.')[0] == 'playwright' for name in modules)
+    # 設定快取就緒時不需要載入 yaml
+    assert 'yaml' not in modules
+    
+    total_ms = sum(top_level.values()) / 1000
+    assert total_ms < IMPORT_BUDGET_MS, f"載入時間 {total_ms:.0f} ms 超過預算"
+
+
+@pytest.mark.parametrize('args', COMMANDS[1:])
+def test_wall_clock_without_browser(args, cli_args):
+    args = cli_args(args)
+    
+    elapsed = []
+    for _ in range(WALL_CLOCK_RUNS):
+        start = time.perf_counter()
+        run_cli(args)
+        elapsed.append((time.perf_counter() - start) * 1000)
+    
+    assert min(elapsed) < WALL_CLOCK_BUDGET_MS, f"執行時間 {min(elapsed):.0f} ms 超過預算"
@@ -0,0 +1,125 @@
+"""
+逐字稿擷取測試（以假的 page.evaluate 模擬頁面，不啟動 Chromium）
+"""
+import gzip
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('playwright.sync_api')
+
+from src import scraper as scraper_module
+from src.config import Config
+from src.scraper import MeetingScraper
+
+
+DATE = '2026-02-12'
+
+
+class FakePage:
+    """
+    模擬頁面中的 window.__transcript，以 UTF-16 code unit 計算長度與切片（與 JS 相同）
+    fail_on_chunk: 第幾次讀取分段時拋出例外
+    """
+    
+    def __init__(self, transcript, fail_on_chunk=None):
+        self.units = transcript.encode('utf-16-le')
+        self.fail_on_chunk = fail_on_chunk
+        self.chunks = []
+        self.deleted = False
+    
+    def _unit(self, index):
+        return int.from_bytes(self.units[index * 2:index * 2 + 2], 'little')
+    
+    def evaluate(self, script, arg=None):
+        if 'delete window.__transcript' in script:
+            self.deleted = True
+            return None
+        
+        length = len(self.units) // 2
+        if arg is None:
+            return length
+        
+        if self.fail_on_chunk == len(self.chunks):
+            raise RuntimeError('Target crashed')
+        
+        start, size = arg
+        end = min(start + size, length)
+        if end < length and 0xD800 <= self._unit(end - 1) <= 0xDBFF:
+            end -= 1
+        # 切斷代理對時以 strict 解碼會失敗
+        chunk = self.units[start * 2:end * 2].decode('utf-16-le')
+        self.chunks.append(chunk)
+        return [chunk, end]
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(
+        f"output:\n  folder: {tmp_path / 'output'}\n"
+        "cache:\n  enabled: false\n",
+        encoding='utf-8'
+    )
+    scraper = MeetingScraper(Config(str(config_path)), verbose=False)
+    monkeypatch.setattr(scraper_module, 'TRANSCRIPT_CHUNK_CHARS', 3)
+    return scraper
+
+
+def save(scraper, monkeypatch, page):
+    monkeypatch.setattr(scraper.browser_manager, 'page', page)
+    meeting = {'subcategory': '週會'}
+    scraper._save_transcript(meeting, '數據週會議', DATE)
+    return meeting
+
+
+def read_transcript(scraper, meeting):
+    with gzip.open(scraper.output_folder / meeting['transcript_file'], 'rt', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_transcript_is_read_in_chunks(scraper, monkeypatch):
+    page = FakePage('abcdefghij')
+    meeting = save(scraper, monkeypatch, page)
+    
+    assert page.chunks == ['abc', 'def', 'ghi', 'j']
+    assert read_transcript(scraper, meeting) == 'abcdefghij'
+    assert page.deleted
+
+
+def test_byte_cap_truncates_on_character_boundary(scraper, monkeypatch):
+    scraper.config._config['options'] = {'transcript_max_bytes': 10}
+    
+    # 每個中文字 3 bytes，10 bytes 的上限只能完整保留 3 個字
+    meeting = save(scraper, monkeypatch, FakePage('會議逐字稿內容'))
+    
+    assert read_transcript(scraper, meeting) == '會議逐'
+
+
+def test_chunks_do_not_split_surrogate_pairs(scraper, monkeypatch):
+    page = FakePage('ab😀c😀')
+    meeting = save(scraper, monkeypatch, page)
+    
+    # 第一段原本會停在 😀 的高位代理之後，改為退回一個 code unit
+    assert page.chunks == ['ab', '😀c', '😀']
+    assert read_transcript(scraper, meeting) == 'ab😀c😀'
+
+
+def test_tmp_file_is_removed_on_error(scraper, monkeypatch):
+    page = FakePage('abcdefghij', fail_on_chunk=1)
+    meeting = save(scraper, monkeypatch, page)
+    
+    assert 'transcript_file' not in meeting
+    assert list(scraper.output_folder.glob('*.transcript.*')) == []
+    assert page.deleted
+
+
+def test_missing_transcript_removes_previous_file(scraper, monkeypatch):
+    meeting = save(scraper, monkeypatch, FakePage('abc'))
+    filepath = scraper.output_folder / meeting['transcript_file']
+    assert filepath.exists()
+    
+    meeting = save(scraper, monkeypatch, FakePage(''))
+    
+    assert 'transcript_file' not in meeting
+    assert not filepath.exists()